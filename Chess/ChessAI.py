@@ -1,4 +1,5 @@
 import random
+from Chess.ChessEngine import BLACK, EMPTY, PIECE_NAMES
 
 # Depth of the algorithm determining AI moves. Higher set_depth == harder AI. Lower if engine is too slow.
 set_depth = 4
@@ -7,6 +8,14 @@ set_depth = 4
 checkmate_points = 1000
 stalemate_points = 0
 
+# Transposition table entries are (depth, score, bound, best move), keyed by the position's Zobrist key.
+# The bound says whether the score is exact or only a lower/upper bound, after an alpha-beta cutoff.
+exact_score = 0
+lower_bound = 1
+upper_bound = 2
+# Entries kept in a transposition table before it is cleared and refilled
+transposition_table_size = 2 ** 17
+
 piece_scores = {'K': 200.0, 'Q': 9.0, 'R': 5.0, 'B': 3.3, 'N': 3.2, 'P': 1.0}
 piece_positions = {
     'wP': [
@@ -117,23 +126,39 @@ piece_positions = {
         [-3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0],
         [-3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0],
         [-3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0]]}
+# Material plus position of each piece code on each square (row * 8 + column), negative for black,
+# so scoring the flat board takes one lookup per piece
+square_scores = tuple(
+    (0.0,) * 64 if name == '--' else tuple(
+        (1 if code < BLACK else -1) * (piece_scores[name[1]] + piece_positions[name][row][column])
+        for row in range(8) for column in range(8)
+    )
+    for code, name in enumerate(PIECE_NAMES)
+)
 
 
 def find_random_move(valid_moves):
     return random.choice(valid_moves)
 
 
-def find_best_move(game_state, valid_moves):
-    """Helper method to make first recursive call"""
+def find_best_move(game_state, valid_moves, tt=None):
+    """
+    Helper method to make first recursive call.
+
+    tt is the transposition table; pass the same dict on every turn of a game so later searches
+    reuse the positions scored by earlier ones.
+    """
     global next_move
     next_move = None
+    if tt is None:
+        tt = {}
     random.shuffle(valid_moves)
     find_negamax_move_alphabeta(game_state, valid_moves, set_depth, -checkmate_points, checkmate_points,
-                                1 if game_state.white_to_move else -1)
+                                1 if game_state.white_to_move else -1, tt)
     return next_move
 
 
-def find_negamax_move_alphabeta(game_state, valid_moves, depth, alpha, beta, turn_multiplier):
+def find_negamax_move_alphabeta(game_state, valid_moves, depth, alpha, beta, turn_multiplier, tt):
     """
     NegaMax algorithm with alpha beta pruning.
 
@@ -147,18 +172,44 @@ def find_negamax_move_alphabeta(game_state, valid_moves, depth, alpha, beta, tur
     White is always trying to maximise score and black is always
     trying to minimise score. Once the possibility of a higher max or lower min
     has been eliminated, there is no need to check further branches.
+
+    Positions already searched at least this deep are looked up in tt rather than searched again,
+    except at the root, where the move itself is needed.
     """
     global next_move
     if depth == 0:
         return turn_multiplier * score_board(game_state)
 
+    key = game_state.zobrist_key
+    original_alpha = alpha
+    entry = tt.get(key)
+    if entry is not None and entry[0] >= depth and depth != set_depth:
+        score, bound = entry[1], entry[2]
+        if bound == exact_score:
+            return score
+        elif bound == lower_bound:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+        if alpha >= beta:
+            return score
+
     max_score = -checkmate_points
-    for move in valid_moves:
+    best_move = None
+    # Searching captures first makes alpha-beta cutoffs come sooner, and the best move found
+    # for this position before, if any, is likely to be best again
+    ordered_moves = game_state.order_moves(valid_moves)
+    if entry is not None and entry[3] in ordered_moves:
+        ordered_moves.remove(entry[3])
+        ordered_moves.insert(0, entry[3])
+    for move in ordered_moves:
         game_state.make_move(move)
         next_moves = game_state.get_valid_moves()
-        score = -find_negamax_move_alphabeta(game_state, next_moves, depth - 1, -beta, -alpha, -turn_multiplier)
+        score = -find_negamax_move_alphabeta(game_state, next_moves, depth - 1, -beta, -alpha, -turn_multiplier,
+                                             tt)
         if score > max_score:
             max_score = score
+            best_move = move
             if depth == set_depth:
                 next_move = move
         game_state.undo_move()
@@ -169,6 +220,16 @@ def find_negamax_move_alphabeta(game_state, valid_moves, depth, alpha, beta, tur
         if alpha >= beta:
             break
 
+    if entry is None or depth >= entry[0]:
+        if max_score <= original_alpha:
+            bound = upper_bound
+        elif max_score >= beta:
+            bound = lower_bound
+        else:
+            bound = exact_score
+        if len(tt) >= transposition_table_size:
+            tt.clear()
+        tt[key] = (depth, max_score, bound, best_move)
     return max_score
 
 
@@ -183,12 +244,7 @@ def score_board(game_state):
         return stalemate_points
 
     score = 0
-    for row in range(len(game_state.board)):
-        for column in range(len(game_state.board)):
-            if game_state.board[row][column][0] == 'w':
-                score += piece_scores[game_state.board[row][column][1]]
-                score += piece_positions[game_state.board[row][column]][row][column]
-            elif game_state.board[row][column][0] == 'b':
-                score -= piece_scores[game_state.board[row][column][1]]
-                score -= piece_positions[game_state.board[row][column]][row][column]
+    for square, piece in enumerate(game_state.board):
+        if piece != EMPTY:
+            score += square_scores[piece][square]
     return score
@@ -1,6 +1,222 @@
 # ChessEngine.py
 
-from Chess import ChessMain
+import random
+
+# Squares are numbered 0..63 as row * 8 + column, so a8 is 0 and h1 is 63.
+# A bitboard is a plain Python int with bit n set when square n is in the set.
+SQUARE_NAMES = tuple(f'{"abcdefgh"[column]}{8 - row}' for row in range(8) for column in range(8))
+
+# Rook directions first, then bishop directions
+DIRECTIONS = (
+    (-1, 0), (0, -1), (1, 0), (0, 1),
+    (-1, -1), (-1, 1), (1, -1), (1, 1)
+)
+DIRECTION_INDEX = {direction: index for index, direction in enumerate(DIRECTIONS)}
+ROOK_DIRECTIONS = (0, 1, 2, 3)
+BISHOP_DIRECTIONS = (4, 5, 6, 7)
+KNIGHT_OFFSETS = (
+    (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+    (1, -2), (1, 2), (2, -1), (2, 1)
+)
+
+# Pieces are small ints: colour bit + piece type, e.g. BLACK + ROOK. 0 is an empty square.
+# piece & 7 gives the type and piece & BLACK the colour. Bitboards are indexed by the same codes.
+EMPTY = 0
+WHITE, BLACK = 0, 8
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(1, 7)
+WP, WN, WB, WR, WQ, WK = range(WHITE + PAWN, WHITE + KING + 1)
+BP, BN, BB, BR, BQ, BK = range(BLACK + PAWN, BLACK + KING + 1)
+# Two character names ('wP', 'bK', '--' for empty) used by the UI, images and notation
+PIECE_NAMES = tuple(
+    colour + type_char if type_char != '-' else '--'
+    for colour in 'wb' for type_char in '-PNBRQK-'
+)
+PIECE_CODES = {name: code for code, name in enumerate(PIECE_NAMES) if name != '--'}
+PIECE_CODES['--'] = EMPTY
+
+START_BOARD = bytes(PIECE_CODES[name] for name in (
+    'bR', 'bN', 'bB', 'bQ', 'bK', 'bB', 'bN', 'bR',
+    'bP', 'bP', 'bP', 'bP', 'bP', 'bP', 'bP', 'bP',
+    '--', '--', '--', '--', '--', '--', '--', '--',
+    '--', '--', '--', '--', '--', '--', '--', '--',
+    '--', '--', '--', '--', '--', '--', '--', '--',
+    '--', '--', '--', '--', '--', '--', '--', '--',
+    'wP', 'wP', 'wP', 'wP', 'wP', 'wP', 'wP', 'wP',
+    'wR', 'wN', 'wB', 'wQ', 'wK', 'wB', 'wN', 'wR'
+))
+
+
+def _build_rays():
+    """RAYS[square][direction]: (row, column) of every square from square to the board edge, exclusive"""
+    rays = []
+    for square in range(64):
+        square_rays = []
+        for d_row, d_column in DIRECTIONS:
+            row, column = divmod(square, 8)
+            ray = []
+            row, column = row + d_row, column + d_column
+            while 0 <= row < 8 and 0 <= column < 8:
+                ray.append((row, column))
+                row, column = row + d_row, column + d_column
+            square_rays.append(tuple(ray))
+        rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+def _build_leaper_attacks(offsets):
+    """Attack bitboard per square for a piece that jumps by the given (row, column) offsets"""
+    attacks = []
+    for square in range(64):
+        row, column = divmod(square, 8)
+        mask = 0
+        for d_row, d_column in offsets:
+            end_row, end_column = row + d_row, column + d_column
+            if 0 <= end_row < 8 and 0 <= end_column < 8:
+                mask |= 1 << (end_row * 8 + end_column)
+        attacks.append(mask)
+    return tuple(attacks)
+
+
+RAYS = _build_rays()
+# RAY_MASKS[direction][square]: the squares of RAYS[square][direction] as a bitboard
+RAY_MASKS = tuple(
+    tuple(sum(1 << (row * 8 + column) for row, column in RAYS[square][direction]) for square in range(64))
+    for direction in range(8)
+)
+# Rays that walk towards higher square indices find their nearest blocker in the lowest set bit
+RAY_IS_FORWARD = tuple(d_row * 8 + d_column > 0 for d_row, d_column in DIRECTIONS)
+KNIGHT_ATTACKS = _build_leaper_attacks(KNIGHT_OFFSETS)
+KING_ATTACKS = _build_leaper_attacks(DIRECTIONS)
+# The same squares as tuples, quicker to loop over in the move generators than peeling off bits
+KNIGHT_TARGETS = tuple(tuple(sq for sq in range(64) if attacks >> sq & 1) for attacks in KNIGHT_ATTACKS)
+KING_TARGETS = tuple(tuple(sq for sq in range(64) if attacks >> sq & 1) for attacks in KING_ATTACKS)
+# PAWN_ATTACKS[0] for white pawns (moving up the board), PAWN_ATTACKS[1] for black pawns
+PAWN_ATTACKS = (
+    _build_leaper_attacks(((-1, -1), (-1, 1))),
+    _build_leaper_attacks(((1, -1), (1, 1)))
+)
+
+# Castling rights flags and, per square, the rights that survive a move from or onto that square
+CASTLE_WHITE_KING_SIDE, CASTLE_WHITE_QUEEN_SIDE = 1, 2
+CASTLE_BLACK_KING_SIDE, CASTLE_BLACK_QUEEN_SIDE = 4, 8
+CASTLE_MASK = [15] * 64
+CASTLE_MASK[0] = 15 ^ CASTLE_BLACK_QUEEN_SIDE  # a8 rook
+CASTLE_MASK[4] = 15 ^ (CASTLE_BLACK_KING_SIDE | CASTLE_BLACK_QUEEN_SIDE)  # e8 king
+CASTLE_MASK[7] = 15 ^ CASTLE_BLACK_KING_SIDE  # h8 rook
+CASTLE_MASK[56] = 15 ^ CASTLE_WHITE_QUEEN_SIDE  # a1 rook
+CASTLE_MASK[60] = 15 ^ (CASTLE_WHITE_KING_SIDE | CASTLE_WHITE_QUEEN_SIDE)  # e1 king
+CASTLE_MASK[63] = 15 ^ CASTLE_WHITE_KING_SIDE  # h1 rook
+CASTLE_MASK = tuple(CASTLE_MASK)
+
+# Piece values for move ordering; the king is only ever an attacker, and the least welcome one
+ORDERING_VALUES = (0, 1, 3, 3, 5, 9, 10)  # Indexed by piece type
+PROMOTION_ORDER_SCORE = 50
+
+# Zobrist keys: a random 64-bit number per piece per square, for black to move and per
+# en passant file. XOR-ing the keys of a position's features gives its hash.
+# Castling is disabled, so castling rights never need hashing.
+_zobrist_random = random.Random(0x5EED)
+ZOBRIST_PIECES = tuple(
+    tuple(_zobrist_random.getrandbits(64) for _ in range(64)) for _ in PIECE_NAMES
+)
+ZOBRIST_BLACK_TO_MOVE = _zobrist_random.getrandbits(64)
+ZOBRIST_EN_PASSANT = tuple(_zobrist_random.getrandbits(64) for _ in range(8))
+
+
+def ray_attacks(square, direction, occupied):
+    """Squares attacked from square along one direction, up to and including the first blocker"""
+    attacks = RAY_MASKS[direction][square]
+    blockers = attacks & occupied
+    if blockers:
+        if RAY_IS_FORWARD[direction]:
+            blocker = (blockers & -blockers).bit_length() - 1
+        else:
+            blocker = blockers.bit_length() - 1
+        attacks ^= RAY_MASKS[direction][blocker]
+    return attacks
+
+
+def slider_attacks(square, directions, occupied):
+    """Union of ray_attacks over directions, inlined since it runs for every slider and attack test"""
+    ray_masks = RAY_MASKS
+    ray_is_forward = RAY_IS_FORWARD
+    attacks = 0
+    for direction in directions:
+        masks = ray_masks[direction]
+        ray = masks[square]
+        blockers = ray & occupied
+        if blockers:
+            if ray_is_forward[direction]:
+                ray ^= masks[(blockers & -blockers).bit_length() - 1]
+            else:
+                ray ^= masks[blockers.bit_length() - 1]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(square, occupied):
+    """Squares a rook on square attacks given the occupied bitboard"""
+    return slider_attacks(square, ROOK_DIRECTIONS, occupied)
+
+
+def bishop_attacks(square, occupied):
+    """Squares a bishop on square attacks given the occupied bitboard"""
+    return slider_attacks(square, BISHOP_DIRECTIONS, occupied)
+
+
+def find_pins_and_checks(bitboards, occupancy, king_square, white_to_move):
+    """
+    Returns (in_check, pins, checks) for the king of the side to move standing on king_square.
+    Pins and checks are (row, column, d_row, d_column) tuples where (d_row, d_column) points
+    from the king towards the piece.
+    """
+    enemy = BLACK if white_to_move else WHITE
+    occupied = occupancy[0] | occupancy[1]
+    own = occupancy[not white_to_move]
+    king_row, king_column = divmod(king_square, 8)
+    pins = []
+    checks = []
+
+    enemy_queens = bitboards[enemy + QUEEN]
+    straight_sliders = bitboards[enemy + ROOK] | enemy_queens
+    diagonal_sliders = bitboards[enemy + BISHOP] | enemy_queens
+    ray_masks = RAY_MASKS
+    for direction in range(8):
+        sliders = straight_sliders if direction < 4 else diagonal_sliders
+        if not ray_masks[direction][king_square] & sliders:
+            continue
+        d_row, d_column = DIRECTIONS[direction]
+        first = ray_attacks(king_square, direction, occupied) & occupied
+        if first & sliders:
+            checks.append((*divmod(first.bit_length() - 1, 8), d_row, d_column))
+        elif first & own:
+            # Look through our piece: an enemy slider behind it pins it to the king
+            beyond = occupied ^ first
+            if ray_attacks(king_square, direction, beyond) & beyond & sliders:
+                pins.append((*divmod(first.bit_length() - 1, 8), d_row, d_column))
+
+    # Pawns, knights and the enemy king attack from a fixed offset, which doubles as the direction
+    attackers = ((PAWN_ATTACKS[not white_to_move][king_square] & bitboards[enemy + PAWN]) |
+                 (KNIGHT_ATTACKS[king_square] & bitboards[enemy + KNIGHT]) |
+                 (KING_ATTACKS[king_square] & bitboards[enemy + KING]))
+    while attackers:
+        bit = attackers & -attackers
+        attackers ^= bit
+        row, column = divmod(bit.bit_length() - 1, 8)
+        checks.append((row, column, row - king_row, column - king_column))
+
+    return len(checks) > 0, pins, checks
+
+
+def move_order_key(move):
+    """Sort key putting likely good moves first: lower keys are searched earlier"""
+    if move.is_capture:
+        # Always above PROMOTION_ORDER_SCORE: 100 + 10 * victim - attacker >= 100
+        return -(100 + 10 * ORDERING_VALUES[move.piece_captured & 7] - ORDERING_VALUES[move.piece_moved & 7])
+    if move.is_pawn_promotion:
+        return -PROMOTION_ORDER_SCORE
+    return 0
+
 
 class GameState:
     """
@@ -8,31 +224,30 @@ class GameState:
     The functions within this class are responsible for how moves are made, undone,
     determining valid moves given the current state, and keeping a move log.
     """
-
     def __init__(self):
         """
-        The board is a 8x8 2d list. Each element has 2 characters.
-        1st character represents the colour of the piece (b/w).
-        2nd character represents the type of the piece.
-        "--" represents an empty space with no piece.
+        The board is a bytearray of 64 piece codes, indexed by row * 8 + column.
+        Each code is a colour (WHITE/BLACK) plus a piece type (PAWN..KING); EMPTY (0) is
+        an empty square. PIECE_NAMES maps a code to its 'wP' style name.
         """
-        self.board = [
-            ['bR', 'bN', 'bB', 'bQ', 'bK', 'bB', 'bN', 'bR'],
-            ['bP', 'bP', 'bP', 'bP', 'bP', 'bP', 'bP', 'bP'],
-            ['--', '--', '--', '--', '--', '--', '--', '--'],
-            ['--', '--', '--', '--', '--', '--', '--', '--'],
-            ['--', '--', '--', '--', '--', '--', '--', '--'],
-            ['--', '--', '--', '--', '--', '--', '--', '--'],
-            ['wP', 'wP', 'wP', 'wP', 'wP', 'wP', 'wP', 'wP'],
-            ['wR', 'wN', 'wB', 'wQ', 'wK', 'wB', 'wN', 'wR']
-        ]
+        self.board = bytearray(START_BOARD)
+        # Bitboards mirror self.board: one per piece code, plus per-colour occupancy.
+        # Any change to the board must go through set_piece so they stay in sync.
+        self.bitboards = [0] * len(PIECE_NAMES)
+        self.occupancy = [0, 0]  # White pieces, black pieces
+        # Pieces of each code on the board; the EMPTY entry is unused
+        self.piece_counts = [0] + [self.board.count(piece) for piece in range(1, len(PIECE_NAMES))]
+        for square, piece in enumerate(self.board):
+            if piece != EMPTY:
+                self.bitboards[piece] |= 1 << square
+                self.occupancy[piece >> 3] |= 1 << square
         self.move_functions = {
-            'P': self.get_pawn_moves,
-            'R': self.get_rook_moves,
-            'N': self.get_knight_moves,
-            'B': self.get_bishop_moves,
-            'Q': self.get_queen_moves,
-            'K': self.get_king_moves  # Castling call is omitted inside get_king_moves
+            PAWN: self.get_pawn_moves,
+            ROOK: self.get_rook_moves,
+            KNIGHT: self.get_knight_moves,
+            BISHOP: self.get_bishop_moves,
+            QUEEN: self.get_queen_moves,
+            KING: self.get_king_moves  # Castling call is omitted inside get_king_moves
         }
         self.white_to_move = True
         self.move_log = []
@@ -42,104 +257,160 @@ class GameState:
         self.stalemate = False
         self.in_check = False
         self.pins = []
+        self.pin_directions = {}  # (row, column) of each pinned piece -> direction of its pin
         self.checks = []
 
         # En passant
         self.en_passant_possible = ()  # Coordinates for square where en passant possible
         self.en_passant_possible_log = [self.en_passant_possible]
 
-        # Castling rights are all False to disable castling
-        self.white_castle_king_side = False
-        self.white_castle_queen_side = False
-        self.black_castle_king_side = False
-        self.black_castle_queen_side = False
-        self.castle_rights_log = [CastleRights(
-            self.white_castle_king_side,
-            self.black_castle_king_side,
-            self.white_castle_queen_side,
-            self.black_castle_queen_side
-        )]
+        # Zobrist hash of the position, updated incrementally as the board changes
+        self.zobrist_key = self.compute_zobrist_key()
+
+        # Castling rights as a bitmask of the CASTLE_* flags; none are granted to disable castling
+        self.castle_rights = 0
+        self.castle_rights_log = [self.castle_rights]
+
+    def set_piece(self, row, column, piece):
+        """
+        Puts the piece code on (row, column), or clears it when piece is EMPTY.
+        Keeps the bitboards, piece counts, Zobrist key and king locations in sync with the board.
+        """
+        square = row * 8 + column
+        bit = 1 << square
+        old_piece = self.board[square]
+        if old_piece != EMPTY:
+            self.bitboards[old_piece] ^= bit
+            self.occupancy[old_piece >> 3] ^= bit
+            self.piece_counts[old_piece] -= 1
+            self.zobrist_key ^= ZOBRIST_PIECES[old_piece][square]
+        self.board[square] = piece
+        if piece != EMPTY:
+            self.bitboards[piece] |= bit
+            self.occupancy[piece >> 3] |= bit
+            self.piece_counts[piece] += 1
+            self.zobrist_key ^= ZOBRIST_PIECES[piece][square]
+            if piece == WK:
+                self.white_king_location = (row, column)
+            elif piece == BK:
+                self.black_king_location = (row, column)
+
+    def find_piece(self, piece):
+        """Returns (row, column) of the first piece with this code in board order, or None if there is none"""
+        bitboard = self.bitboards[piece]
+        if not bitboard:
+            return None
+        return divmod((bitboard & -bitboard).bit_length() - 1, 8)
 
     def make_move(self, move):
         """Takes a move as a parameter, executes it, and updates move log"""
-        self.board[move.start_row][move.start_column] = '--'
-        self.board[move.end_row][move.end_column] = move.piece_moved
+        self.set_piece(move.start_row, move.start_column, EMPTY)
+        self.set_piece(move.end_row, move.end_column, move.piece_moved)
         self.move_log.append(move)
 
-        if move.piece_moved == 'wK':
-            self.white_king_location = (move.end_row, move.end_column)
-        elif move.piece_moved == 'bK':
-            self.black_king_location = (move.end_row, move.end_column)
-
         # Pawn promotion
         if move.is_pawn_promotion:
             # Automatically promote to Rook if allowed
-            promoted_piece = 'R'
-            self.board[move.end_row][move.end_column] = move.piece_moved[0] + promoted_piece
+            promoted_piece = ROOK
+            self.set_piece(move.end_row, move.end_column, (move.piece_moved & BLACK) + promoted_piece)
 
         # En passant capture
         if move.is_en_passant_move:
-            self.board[move.start_row][move.end_column] = '--'
+            self.set_piece(move.start_row, move.end_column, EMPTY)
 
         # Update en passant possible square
-        if move.piece_moved[1] == 'P' and abs(move.start_row - move.end_row) == 2:
+        if self.en_passant_possible:
+            self.zobrist_key ^= ZOBRIST_EN_PASSANT[self.en_passant_possible[1]]
+        if move.piece_moved & 7 == PAWN and abs(move.start_row - move.end_row) == 2:
             self.en_passant_possible = ((move.start_row + move.end_row) // 2, move.start_column)
+            self.zobrist_key ^= ZOBRIST_EN_PASSANT[move.start_column]
         else:
             self.en_passant_possible = ()
         self.en_passant_possible_log.append(self.en_passant_possible)
 
         # Castling move: since castling is disabled, no move will ever have is_castle_move=True
 
-        # Update castling rights (they remain False, but we keep log logic for consistency)
+        # Update castling rights (they remain 0, but we keep log logic for consistency)
         self.update_castle_rights(move)
-        self.castle_rights_log.append(CastleRights(
-            self.white_castle_king_side,
-            self.black_castle_king_side,
-            self.white_castle_queen_side,
-            self.black_castle_queen_side
-        ))
+        self.castle_rights_log.append(self.castle_rights)
 
         # Switch turn
         self.white_to_move = not self.white_to_move
+        self.zobrist_key ^= ZOBRIST_BLACK_TO_MOVE
 
     def undo_move(self):
         """Undoes last move made"""
         if len(self.move_log) != 0:
             move = self.move_log.pop()
-            self.board[move.start_row][move.start_column] = move.piece_moved
-            self.board[move.end_row][move.end_column] = move.piece_captured
+            # set_piece also restores the king location when the king moved
+            self.set_piece(move.start_row, move.start_column, move.piece_moved)
+            self.set_piece(move.end_row, move.end_column, move.piece_captured)
             self.white_to_move = not self.white_to_move
-
-            # Restore king positions
-            if move.piece_moved == 'wK':
-                self.white_king_location = (move.start_row, move.start_column)
-            elif move.piece_moved == 'bK':
-                self.black_king_location = (move.start_row, move.start_column)
+            self.zobrist_key ^= ZOBRIST_BLACK_TO_MOVE
 
             # Undo en passant
             if move.is_en_passant_move:
-                self.board[move.end_row][move.end_column] = '--'
-                self.board[move.start_row][move.end_column] = move.piece_captured
+                self.set_piece(move.end_row, move.end_column, EMPTY)
+                self.set_piece(move.start_row, move.end_column, move.piece_captured)
+            if self.en_passant_possible:
+                self.zobrist_key ^= ZOBRIST_EN_PASSANT[self.en_passant_possible[1]]
             self.en_passant_possible_log.pop()
             self.en_passant_possible = self.en_passant_possible_log[-1]
+            if self.en_passant_possible:
+                self.zobrist_key ^= ZOBRIST_EN_PASSANT[self.en_passant_possible[1]]
 
             # Undo castling rights
             self.castle_rights_log.pop()
-            castle_rights = self.castle_rights_log[-1]
-            self.white_castle_king_side = castle_rights.white_king_side
-            self.black_castle_king_side = castle_rights.black_king_side
-            self.white_castle_queen_side = castle_rights.white_queen_side
-            self.black_castle_queen_side = castle_rights.black_queen_side
+            self.castle_rights = self.castle_rights_log[-1]
 
             # Undo castling move on board: never triggered here since no castling moves exist
 
             self.checkmate = False
             self.stalemate = False
 
+    def compute_zobrist_key(self):
+        """Hashes the current position from scratch"""
+        key = 0
+        for index, bitboard in enumerate(self.bitboards):
+            while bitboard:
+                bit = bitboard & -bitboard
+                bitboard ^= bit
+                key ^= ZOBRIST_PIECES[index][bit.bit_length() - 1]
+        if not self.white_to_move:
+            key ^= ZOBRIST_BLACK_TO_MOVE
+        if self.en_passant_possible:
+            key ^= ZOBRIST_EN_PASSANT[self.en_passant_possible[1]]
+        return key
+
     def get_valid_moves(self):
         """Gets all moves considering checks"""
-        valid_moves = []
         self.in_check, self.pins, self.checks = self.check_for_pins_and_checks()
+        self.pin_directions = {(pin[0], pin[1]): (pin[2], pin[3]) for pin in self.pins}
+        valid_moves = self.generate_valid_moves()
+
+        if len(valid_moves) == 0:
+            if self.in_check:
+                self.checkmate = True
+            else:
+                self.stalemate = True
+        else:
+            self.checkmate = False
+            self.stalemate = False
+
+        return valid_moves
+
+    @staticmethod
+    def order_moves(moves):
+        """
+        Returns moves sorted for search: captures first, by most valuable victim and then least
+        valuable attacker (MVV-LVA), then promotions, then quiet moves.
+        The sort is stable, so equally ranked moves keep their order.
+        """
+        return sorted(moves, key=move_order_key)
+
+    def generate_valid_moves(self):
+        """Generates all moves considering the checks and pins found by check_for_pins_and_checks"""
+        valid_moves = []
 
         if self.white_to_move:
             king_row, king_column = self.white_king_location
@@ -151,45 +422,35 @@ class GameState:
                 valid_moves = self.get_all_possible_moves()
                 check = self.checks[0]
                 check_row, check_column = check[0], check[1]
-                piece_checking = self.board[check_row][check_column]
-                valid_squares = []
-                if piece_checking[1] == 'N':
-                    valid_squares = [(check_row, check_column)]
+                check_square = check_row * 8 + check_column
+                piece_checking = self.board[check_square]
+                # Bitboard of squares a non-king move must land on: capture the checker or block
+                if piece_checking & 7 == KNIGHT:
+                    valid_squares = 1 << check_square
                 else:
-                    for i in range(1, len(self.board)):
-                        valid_square = (king_row + check[2] * i, king_column + check[3] * i)
-                        valid_squares.append(valid_square)
-                        if valid_square[0] == check_row and valid_square[1] == check_column:
-                            break
-                for i in range(len(valid_moves) - 1, -1, -1):
-                    if valid_moves[i].piece_moved[1] != 'K':
-                        if not (valid_moves[i].end_row, valid_moves[i].end_column) in valid_squares:
-                            valid_moves.remove(valid_moves[i])
+                    # The ray from the king up to and including the checking piece
+                    direction = DIRECTION_INDEX[(check[2], check[3])]
+                    valid_squares = (RAY_MASKS[direction][king_row * 8 + king_column] ^
+                                     RAY_MASKS[direction][check_square])
+                valid_moves = [
+                    move for move in valid_moves
+                    if move.piece_moved & 7 == KING or valid_squares >> (move.end_row * 8 + move.end_column) & 1
+                ]
             else:
                 self.get_king_moves(king_row, king_column, valid_moves)
         else:
             valid_moves = self.get_all_possible_moves()
 
-        if len(valid_moves) == 0:
-            if self.in_check:
-                self.checkmate = True
-            else:
-                self.stalemate = True
-        else:
-            self.checkmate = False
-            self.stalemate = False
-
         return valid_moves
 
     def get_all_possible_moves(self):
         """Gets all moves without considering checks"""
         moves = []
-        for row in range(len(self.board)):
-            for column in range(len(self.board[row])):
-                turn = self.board[row][column][0]
-                if (turn == 'w' and self.white_to_move) or (turn == 'b' and not self.white_to_move):
-                    piece = self.board[row][column][1]
-                    self.move_functions[piece](row, column, moves)
+        colour = WHITE if self.white_to_move else BLACK
+        for square, piece in enumerate(self.board):
+            if piece != EMPTY and piece & BLACK == colour:
+                row, column = divmod(square, 8)
+                self.move_functions[piece & 7](row, column, moves)
         return moves
 
     def get_pawn_moves(self, row, column, moves):
@@ -197,244 +458,179 @@ class GameState:
         Gets all pawn moves for the pawn located at (row, column) and adds moves to move log.
         Only allows promotion if one of the side’s rooks has already been captured.
         """
-        # 1) Count current rooks on board for this side
-        white_rooks_onboard = sum(1 for r in self.board for piece in r if piece == 'wR')
-        black_rooks_onboard = sum(1 for r in self.board for piece in r if piece == 'bR')
-
-        piece_pinned = False
-        pin_direction = ()
-        for i in range(len(self.pins) - 1, -1, -1):
-            if self.pins[i][0] == row and self.pins[i][1] == column:
-                piece_pinned = True
-                pin_direction = (self.pins[i][2], self.pins[i][3])
-                self.pins.remove(self.pins[i])
-                break
+        pin_direction = self.pin_directions.get((row, column))
+        piece_pinned = pin_direction is not None
 
         if self.white_to_move:
             move_amount = -1
             start_row = 6
             back_row = 0
-            opponent = 'b'
-            king_row, king_column = self.white_king_location
-            rooks_alive = white_rooks_onboard
+            opponent = BLACK
+            rooks_alive = self.piece_counts[WR]
         else:
             move_amount = 1
             start_row = 1
             back_row = 7
-            opponent = 'w'
-            king_row, king_column = self.black_king_location
-            rooks_alive = black_rooks_onboard
+            opponent = WHITE
+            rooks_alive = self.piece_counts[BR]
 
         # Determine if promotion is allowed: at least one rook of this color has died
         # (i.e., if rooks_alive < 2)
         promotion_allowed = (rooks_alive < 2)
 
+        piece = self.board[row * 8 + column]
+        end_row = row + move_amount
+        # Off the board: only a pawn put on its last row by a special action gets here
+        if end_row & ~7:
+            return
+
         # One‐square forward
-        if 0 <= row + move_amount < 8:
-            if self.board[row + move_amount][column] == '--':
-                if not piece_pinned or pin_direction == (move_amount, 0):
-                    if row + move_amount == back_row and promotion_allowed:
-                        moves.append(Move(
-                            (row, column),
-                            (row + move_amount, column),
-                            self.board,
-                            pawn_promotion=True
-                        ))
-                    elif row + move_amount != back_row:
-                        moves.append(Move(
-                            (row, column),
-                            (row + move_amount, column),
-                            self.board
-                        ))
-                # Two‐square forward
-                if row == start_row and self.board[row + 2 * move_amount][column] == '--':
+        if self.board[end_row * 8 + column] == EMPTY:
+            if not piece_pinned or pin_direction == (move_amount, 0):
+                if end_row == back_row and promotion_allowed:
                     moves.append(Move(
                         (row, column),
-                        (row + 2 * move_amount, column),
-                        self.board
+                        (end_row, column),
+                        piece, EMPTY,
+                        pawn_promotion=True
                     ))
+                elif end_row != back_row:
+                    moves.append(Move(
+                        (row, column),
+                        (end_row, column),
+                        piece, EMPTY
+                    ))
+            # Two‐square forward
+            if row == start_row and self.board[(row + 2 * move_amount) * 8 + column] == EMPTY:
+                moves.append(Move(
+                    (row, column),
+                    (row + 2 * move_amount, column),
+                    piece, EMPTY
+                ))
 
         # Capture to the left
-        if column - 1 >= 0 and 0 <= row + move_amount < 8:
+        if column > 0:
             if not piece_pinned or pin_direction == (move_amount, -1):
-                target = self.board[row + move_amount][column - 1]
-                if target[0] == opponent:
-                    if row + move_amount == back_row and promotion_allowed:
+                target = self.board[end_row * 8 + column - 1]
+                if target != EMPTY and target & BLACK == opponent:
+                    if end_row == back_row and promotion_allowed:
                         moves.append(Move(
                             (row, column),
-                            (row + move_amount, column - 1),
-                            self.board,
+                            (end_row, column - 1),
+                            piece, target,
                             pawn_promotion=True
                         ))
-                    elif row + move_amount != back_row:
+                    elif end_row != back_row:
                         moves.append(Move(
                             (row, column),
-                            (row + move_amount, column - 1),
-                            self.board
+                            (end_row, column - 1),
+                            piece, target
                         ))
                 # En passant capture
-                if (row + move_amount, column - 1) == self.en_passant_possible:
-                    attacking_piece = blocking_piece = False
-                    if king_row == row:
-                        if king_column < column:
-                            inside_range = range(king_column + 1, column - 1)
-                            outside_range = range(column + 1, len(self.board))
-                        else:
-                            inside_range = range(king_column - 1, column, -1)
-                            outside_range = range(column - 2, -1, -1)
-                        for i in inside_range:
-                            if self.board[row][i] != '--':
-                                blocking_piece = True
-                        for i in outside_range:
-                            square = self.board[row][i]
-                            if square[0] == opponent and (square[1] == 'R' or square[1] == 'Q'):
-                                attacking_piece = True
-                            elif square != '--':
-                                blocking_piece = True
-                    if not attacking_piece or blocking_piece:
+                if (end_row, column - 1) == self.en_passant_possible:
+                    if not self.en_passant_exposes_king(row, column, column - 1):
                         moves.append(Move(
                             (row, column),
-                            (row + move_amount, column - 1),
-                            self.board,
+                            (end_row, column - 1),
+                            piece, opponent + PAWN,
                             en_passant=True
                         ))
 
         # Capture to the right
-        if column + 1 < 8 and 0 <= row + move_amount < 8:
+        if column < 7:
             if not piece_pinned or pin_direction == (move_amount, 1):
-                target = self.board[row + move_amount][column + 1]
-                if target[0] == opponent:
-                    if row + move_amount == back_row and promotion_allowed:
+                target = self.board[end_row * 8 + column + 1]
+                if target != EMPTY and target & BLACK == opponent:
+                    if end_row == back_row and promotion_allowed:
                         moves.append(Move(
                             (row, column),
-                            (row + move_amount, column + 1),
-                            self.board,
+                            (end_row, column + 1),
+                            piece, target,
                             pawn_promotion=True
                         ))
-                    elif row + move_amount != back_row:
+                    elif end_row != back_row:
                         moves.append(Move(
                             (row, column),
-                            (row + move_amount, column + 1),
-                            self.board
+                            (end_row, column + 1),
+                            piece, target
                         ))
                 # En passant capture
-                if (row + move_amount, column + 1) == self.en_passant_possible:
-                    attacking_piece = blocking_piece = False
-                    if king_row == row:
-                        if king_column < column:
-                            inside_range = range(king_column + 1, column)
-                            outside_range = range(column + 2, len(self.board))
-                        else:
-                            inside_range = range(king_column - 1, column + 1, -1)
-                            outside_range = range(column - 1, -1, -1)
-                        for i in inside_range:
-                            if self.board[row][i] != '--':
-                                blocking_piece = True
-                        for i in outside_range:
-                            square = self.board[row][i]
-                            if square[0] == opponent and (square[1] == 'R' or square[1] == 'Q'):
-                                attacking_piece = True
-                            elif square != '--':
-                                blocking_piece = True
-                    if not attacking_piece or blocking_piece:
+                if (end_row, column + 1) == self.en_passant_possible:
+                    if not self.en_passant_exposes_king(row, column, column + 1):
                         moves.append(Move(
                             (row, column),
-                            (row + move_amount, column + 1),
-                            self.board,
+                            (end_row, column + 1),
+                            piece, opponent + PAWN,
                             en_passant=True
                         ))
 
+    def en_passant_exposes_king(self, row, column, captured_column):
+        """
+        Checks if capturing en passant with the pawn at (row, column) would leave our king,
+        standing on the same row, attacked by an enemy rook or queen once both pawns leave the row
+        """
+        if self.white_to_move:
+            king_row, king_column = self.white_king_location
+            opponent = BLACK
+        else:
+            king_row, king_column = self.black_king_location
+            opponent = WHITE
+        if king_row != row:
+            return False
+        direction = DIRECTION_INDEX[(0, 1) if king_column < column else (0, -1)]
+        for end_row, end_column in RAYS[king_row * 8 + king_column][direction]:
+            if end_column == column or end_column == captured_column:
+                continue
+            end_piece = self.board[end_row * 8 + end_column]
+            if end_piece != EMPTY:
+                return end_piece == opponent + ROOK or end_piece == opponent + QUEEN
+        return False
+
     def get_rook_moves(self, row, column, moves):
         """Gets all rook moves for the rook located at (row, column) and adds moves to move log"""
-        opponent = 'b' if self.white_to_move else 'w'
-
-        piece_pinned = False
-        pin_direction = ()
-        for i in range(len(self.pins) - 1, -1, -1):
-            if self.pins[i][0] == row and self.pins[i][1] == column:
-                piece_pinned = True
-                pin_direction = (self.pins[i][2], self.pins[i][3])
-                if self.board[row][column][1] != 'Q':
-                    self.pins.remove(self.pins[i])
-                break
-
-        directions = [(-1, 0), (0, -1), (1, 0), (0, 1)]
-        for d in directions:
-            for i in range(1, len(self.board)):
-                end_row = row + d[0] * i
-                end_column = column + d[1] * i
-                if 0 <= end_row < len(self.board) and 0 <= end_column < len(self.board):
-                    if not piece_pinned or pin_direction == d or pin_direction == (-d[0], -d[1]):
-                        end_piece = self.board[end_row][end_column]
-                        if end_piece == '--':
-                            moves.append(Move(
-                                (row, column),
-                                (end_row, end_column),
-                                self.board
-                            ))
-                        elif end_piece[0] == opponent:
-                            moves.append(Move(
-                                (row, column),
-                                (end_row, end_column),
-                                self.board
-                            ))
-                            break
-                        else:
-                            break
-                else:
-                    break
+        pin_direction = self.pin_directions.get((row, column))
+        self.get_slider_moves(row, column, ROOK_DIRECTIONS, pin_direction, moves)
 
     def get_knight_moves(self, row, column, moves):
         """Gets all knight moves for the knight located at (row, column) and adds moves to move log"""
-        opponent = 'b' if self.white_to_move else 'w'
-        piece_pinned = False
-        for i in range(len(self.pins) - 1, -1, -1):
-            if self.pins[i][0] == row and self.pins[i][1] == column:
-                piece_pinned = True
-                self.pins.remove(self.pins[i])
-                break
-
-        directions = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
-        for d in directions:
-            end_row = row + d[0]
-            end_column = column + d[1]
-            if 0 <= end_row < len(self.board) and 0 <= end_column < len(self.board):
-                if not piece_pinned:
-                    end_piece = self.board[end_row][end_column]
-                    if end_piece[0] == opponent:
-                        moves.append(Move((row, column), (end_row, end_column), self.board))
-                    elif end_piece == '--':
-                        moves.append(Move((row, column), (end_row, end_column), self.board))
+        if (row, column) not in self.pin_directions:
+            board = self.board
+            piece = board[row * 8 + column]
+            colour = piece & BLACK
+            for end_square in KNIGHT_TARGETS[row * 8 + column]:
+                end_piece = board[end_square]
+                if end_piece == EMPTY or end_piece & BLACK != colour:
+                    moves.append(Move((row, column), divmod(end_square, 8), piece, end_piece))
 
     def get_bishop_moves(self, row, column, moves):
         """Gets all bishop moves for the bishop located at (row, column) and adds moves to move log"""
-        opponent = 'b' if self.white_to_move else 'w'
-        piece_pinned = False
-        pin_direction = ()
-        for i in range(len(self.pins) - 1, -1, -1):
-            if self.pins[i][0] == row and self.pins[i][1] == column:
-                piece_pinned = True
-                pin_direction = (self.pins[i][2], self.pins[i][3])
-                self.pins.remove(self.pins[i])
-                break
-
-        directions = [(-1, -1), (-1, 1), (1, 1), (1, -1)]
-        for d in directions:
-            for i in range(1, len(self.board)):
-                end_row = row + d[0] * i
-                end_column = column + d[1] * i
-                if 0 <= end_row < len(self.board) and 0 <= end_column < len(self.board):
-                    if not piece_pinned or pin_direction == d or pin_direction == (-d[0], -d[1]):
-                        end_piece = self.board[end_row][end_column]
-                        if end_piece == '--':
-                            moves.append(Move((row, column), (end_row, end_column), self.board))
-                        elif end_piece[0] == opponent:
-                            moves.append(Move((row, column), (end_row, end_column), self.board))
-                            break
-                        else:
-                            break
-                else:
-                    break
+        pin_direction = self.pin_directions.get((row, column))
+        self.get_slider_moves(row, column, BISHOP_DIRECTIONS, pin_direction, moves)
+
+    def get_slider_moves(self, row, column, directions, pin_direction, moves):
+        """
+        Adds moves along the given ray directions for the slider at (row, column).
+        A pinned slider (pin_direction is not None) may only move along the line of its pin.
+        """
+        occupancy = self.occupancy
+        if pin_direction is not None:
+            directions = [
+                direction for direction in directions
+                if DIRECTIONS[direction] == pin_direction or
+                DIRECTIONS[direction] == (-pin_direction[0], -pin_direction[1])
+            ]
+        targets = slider_attacks(row * 8 + column, directions, occupancy[0] | occupancy[1])
+        self.add_moves_to_targets(row, column, targets & ~occupancy[not self.white_to_move], moves)
+
+    def add_moves_to_targets(self, row, column, targets, moves):
+        """Adds a move from (row, column) to every square set in the targets bitboard"""
+        board = self.board
+        piece = board[row * 8 + column]
+        while targets:
+            bit = targets & -targets
+            end_square = bit.bit_length() - 1
+            moves.append(Move((row, column), divmod(end_square, 8), piece, board[end_square]))
+            targets ^= bit
 
     def get_queen_moves(self, row, column, moves):
         """Gets all queen moves for the queen located at (row, column) and adds moves to move log"""
@@ -443,159 +639,50 @@ class GameState:
 
     def get_king_moves(self, row, column, moves):
         """Gets all king moves for the king located at (row, column) and adds moves to move log (no castling)"""
-        ally = 'w' if self.white_to_move else 'b'
-        row_moves = (-1, -1, -1, 0, 0, 1, 1, 1)
-        column_moves = (-1, 0, 1, -1, 1, -1, 0, 1)
-        for i in range(len(self.board)):
-            end_row = row + row_moves[i]
-            end_column = column + column_moves[i]
-            if 0 <= end_row < len(self.board) and 0 <= end_column < len(self.board):
-                end_piece = self.board[end_row][end_column]
-                if end_piece[0] != ally:
-                    # Temporarily move king and check for checks
-                    if ally == 'w':
-                        self.white_king_location = (end_row, end_column)
-                    else:
-                        self.black_king_location = (end_row, end_column)
-                    in_check, pins, checks = self.check_for_pins_and_checks()
-                    if not in_check:
-                        moves.append(Move((row, column), (end_row, end_column), self.board))
-                    # Revert king location
-                    if ally == 'w':
-                        self.white_king_location = (row, column)
-                    else:
-                        self.black_king_location = (row, column)
+        square = row * 8 + column
+        # Lift the king off the board so it cannot shelter the squares behind it from a slider
+        occupied = (self.occupancy[0] | self.occupancy[1]) ^ (1 << square)
+        enemy = BLACK if self.white_to_move else WHITE
+        board = self.board
+        piece = board[square]
+        for end_square in KING_TARGETS[square]:
+            end_piece = board[end_square]
+            if end_piece != EMPTY and end_piece & BLACK != enemy:
+                continue  # Our own piece
+            if not self.attackers_to(end_square, occupied, enemy):
+                moves.append(Move((row, column), divmod(end_square, 8), piece, end_piece))
         # No call to get_castle_moves – castling is disabled
 
     def update_castle_rights(self, move):
-        """Updates castle rights given the move (castling disabled, so rights stay False)"""
-        # No changes to any rights; they remain False
-        pass
+        """Updates castle rights given the move: moving from or onto a king or rook home square drops its rights"""
+        self.castle_rights &= (CASTLE_MASK[move.start_row * 8 + move.start_column] &
+                               CASTLE_MASK[move.end_row * 8 + move.end_column])
 
     def square_under_attack(self, row, column, ally):
-        """Checks outward from a square to see if it is being attacked, thus invalidating castling"""
-        opponent = 'b' if self.white_to_move else 'w'
-        directions = (
-            (-1, 0), (0, -1), (1, 0), (0, 1),
-            (-1, -1), (-1, 1), (1, -1), (1, 1)
-        )
-        for j in range(len(directions)):
-            d = directions[j]
-            for i in range(1, len(self.board)):
-                end_row = row + d[0] * i
-                end_column = column + d[1] * i
-                if 0 <= end_row < len(self.board) and 0 <= end_column < len(self.board):
-                    end_piece = self.board[end_row][end_column]
-                    if end_piece[0] == ally:
-                        break
-                    elif end_piece[0] == opponent:
-                        piece_type = end_piece[1]
-                        if (
-                            (0 <= j <= 3 and piece_type == 'R') or
-                            (4 <= j <= 7 and piece_type == 'B') or
-                            (i == 1 and piece_type == 'P' and
-                                ((opponent == 'w' and 6 <= j <= 7) or (opponent == 'b' and 4 <= j <= 5))
-                            ) or
-                            piece_type == 'Q' or
-                            (i == 1 and piece_type == 'K')
-                        ):
-                            return True
-                        else:
-                            break
-                else:
-                    break
-        knight_moves = (
-            (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-            (1, -2), (1, 2), (2, -1), (2, 1)
-        )
-        for m in knight_moves:
-            end_row = row + m[0]
-            end_column = column + m[1]
-            if 0 <= end_row < len(self.board) and 0 <= end_column < len(self.board):
-                end_piece = self.board[end_row][end_column]
-                if end_piece[0] == opponent and end_piece[1] == 'N':
-                    return True
-        return False
+        """Checks if any piece of ally's (WHITE or BLACK) opponent attacks (row, column), thus invalidating castling"""
+        occupied = self.occupancy[0] | self.occupancy[1]
+        return self.attackers_to(row * 8 + column, occupied, ally ^ BLACK) != 0
+
+    def attackers_to(self, square, occupied, enemy):
+        """Bitboard of enemy (WHITE or BLACK) pieces attacking square, given the occupied bitboard"""
+        bitboards = self.bitboards
+        enemy_queens = bitboards[enemy + QUEEN]
+        # A pawn of our colour on square would attack exactly the enemy pawns that attack it
+        return ((PAWN_ATTACKS[enemy == WHITE][square] & bitboards[enemy + PAWN]) |
+                (KNIGHT_ATTACKS[square] & bitboards[enemy + KNIGHT]) |
+                (KING_ATTACKS[square] & bitboards[enemy + KING]) |
+                (bishop_attacks(square, occupied) & (bitboards[enemy + BISHOP] | enemy_queens)) |
+                (rook_attacks(square, occupied) & (bitboards[enemy + ROOK] | enemy_queens)))
 
     def check_for_pins_and_checks(self):
         """Returns if the player is in check, a list of pins, and a list of checks"""
-        pins = []
-        checks = []
-        in_check = False
-
         if self.white_to_move:
-            opponent = 'b'
-            ally = 'w'
-            start_row, start_column = self.white_king_location
+            king_row, king_column = self.white_king_location
         else:
-            opponent = 'w'
-            ally = 'b'
-            start_row, start_column = self.black_king_location
-
-        directions = (
-            (-1, 0), (0, -1), (1, 0), (0, 1),
-            (-1, -1), (-1, 1), (1, -1), (1, 1)
-        )
-        for j in range(len(directions)):
-            d = directions[j]
-            possible_pin = ()
-            for i in range(1, len(self.board)):
-                end_row = start_row + d[0] * i
-                end_column = start_column + d[1] * i
-                if 0 <= end_row < len(self.board) and 0 <= end_column < len(self.board):
-                    end_piece = self.board[end_row][end_column]
-                    if end_piece[0] == ally and end_piece[1] != 'K':
-                        if possible_pin == ():
-                            possible_pin = (end_row, end_column, d[0], d[1])
-                        else:
-                            break
-                    elif end_piece[0] == opponent:
-                        piece_type = end_piece[1]
-                        if (
-                            (0 <= j <= 3 and piece_type == 'R') or
-                            (4 <= j <= 7 and piece_type == 'B') or
-                            (i == 1 and piece_type == 'P' and
-                                ((opponent == 'w' and 6 <= j <= 7) or (opponent == 'b' and 4 <= j <= 5))
-                            ) or
-                            piece_type == 'Q' or
-                            (i == 1 and piece_type == 'K')
-                        ):
-                            if possible_pin == ():
-                                in_check = True
-                                checks.append((end_row, end_column, d[0], d[1]))
-                                break
-                            else:
-                                pins.append(possible_pin)
-                                break
-                        else:
-                            break
-                else:
-                    break
-
-        knight_moves = (
-            (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-            (1, -2), (1, 2), (2, -1), (2, 1)
+            king_row, king_column = self.black_king_location
+        return find_pins_and_checks(
+            self.bitboards, self.occupancy, king_row * 8 + king_column, self.white_to_move
         )
-        for m in knight_moves:
-            end_row = start_row + m[0]
-            end_column = start_column + m[1]
-            if 0 <= end_row < len(self.board) and 0 <= end_column < len(self.board):
-                end_piece = self.board[end_row][end_column]
-                if end_piece[0] == opponent and end_piece[1] == 'N':
-                    in_check = True
-                    checks.append((end_row, end_column, m[0], m[1]))
-
-        return in_check, pins, checks
-
-
-class CastleRights:
-    """Data storage of current states of castling rights"""
-
-    def __init__(self, white_king_side, black_king_side, white_queen_side, black_queen_side):
-        self.white_king_side = white_king_side
-        self.black_king_side = black_king_side
-        self.white_queen_side = white_queen_side
-        self.black_queen_side = black_queen_side
 
 
 class Move:
@@ -610,57 +697,66 @@ class Move:
     files_to_columns = {'a': 0, 'b': 1, 'c': 2, 'd': 3,
                         'e': 4, 'f': 5, 'g': 6, 'h': 7}
     columns_to_files = {v: k for k, v in files_to_columns.items()}
-
-    def __init__(self, start_square, end_square, board, en_passant=False, pawn_promotion=False, castle=False):
+    # Moves are created by the tens of thousands during a search, so skip the per-instance __dict__
+    __slots__ = (
+        'start_row', 'start_column', 'end_row', 'end_column', 'piece_moved', 'piece_captured',
+        'is_pawn_promotion', 'is_en_passant_move', 'is_castle_move', 'is_capture', 'move_id'
+    )
+
+    def __init__(self, start_square, end_square, piece_moved, piece_captured,
+                 en_passant=False, pawn_promotion=False, castle=False):
+        """
+        piece_moved and piece_captured are the piece codes on the start and end squares,
+        except that an en passant capture takes the pawn beside the end square
+        """
         self.start_row, self.start_column = start_square
         self.end_row, self.end_column = end_square
-        self.piece_moved = board[self.start_row][self.start_column]
-        self.piece_captured = board[self.end_row][self.end_column]
+        self.piece_moved = piece_moved
+        self.piece_captured = piece_captured
         self.is_pawn_promotion = pawn_promotion
 
         # En passant
         self.is_en_passant_move = en_passant
-        if self.is_en_passant_move:
-            self.piece_captured = 'wP' if self.piece_moved == 'bP' else 'bP'
 
         # Castling flag (never used since castling is disabled)
         self.is_castle_move = castle
-        self.is_capture = (self.piece_captured != '--')
-        self.move_id = (self.start_row * 1000 +
-                        self.start_column * 100 +
-                        self.end_row * 10 +
-                        self.end_column)
+        self.is_capture = (self.piece_captured != EMPTY)
+        # Start square in the low 6 bits, end square in the next 6
+        self.move_id = ((self.start_row * 8 + self.start_column) |
+                        (self.end_row * 8 + self.end_column) << 6)
 
     def __eq__(self, other):
         if isinstance(other, Move):
             return self.move_id == other.move_id
         return False
 
+    def __hash__(self):
+        return self.move_id
+
     def get_chess_notation(self):
-        return (self.get_rank_file(self.start_row, self.start_column) +
-                self.get_rank_file(self.end_row, self.end_column))
+        return SQUARE_NAMES[self.move_id & 63] + SQUARE_NAMES[self.move_id >> 6]
 
     def get_rank_file(self, row, col):
-        return self.columns_to_files[col] + self.rows_to_ranks[row]
+        return SQUARE_NAMES[row * 8 + col]
 
     def __str__(self):
         # Castling (never used)
         if self.is_castle_move:
             return 'O-O' if self.end_column == 6 else 'O-O-O'
 
-        end_sq = self.get_rank_file(self.end_row, self.end_column)
+        end_sq = SQUARE_NAMES[self.move_id >> 6]
 
         # Pawn moves
-        if self.piece_moved[1] == 'P':
+        if self.piece_moved & 7 == PAWN:
             if self.is_capture and self.is_pawn_promotion:
                 return f'{end_sq}=R'
             elif self.is_capture:
-                return f'{self.columns_to_files[self.start_column]}x{end_sq}'
+                return f'{SQUARE_NAMES[self.move_id & 63][0]}x{end_sq}'
             else:
                 return end_sq
 
         # Other piece moves
-        move_str = self.piece_moved[1]
+        move_str = PIECE_NAMES[self.piece_moved][1]
         if self.is_capture:
             move_str += 'x'
         return f'{move_str}{end_sq}'
@@ -1,4 +1,7 @@
+import copy
 import os
+import queue
+import threading
 import pygame as p
 from Chess import ChessEngine, ChessAI
 
@@ -16,7 +19,29 @@ dimension = 8
 sq_size = board_height // dimension
 max_fps = 15
 colours = [p.Color('#EBEBD0'), p.Color('#769455')]
-images = {}
+images = [None] * len(ChessEngine.PIECE_NAMES)  # Piece image by piece code
+# Squares (row * 8 + column) around each square, in board order, for Defect's 8 neighbours
+neighbour_squares = ChessEngine.KING_TARGETS
+# Detonate's 3x3 blast around each square as a bitboard, so only occupied squares are visited
+blast_masks = tuple(attacks | 1 << square for square, attacks in enumerate(ChessEngine.KING_ATTACKS))
+# Screen rect and colour of each square (row * 8 + column), built once instead of per frame
+square_rects = tuple(
+    p.Rect(column * sq_size, row * sq_size, sq_size, sq_size)
+    for row in range(dimension) for column in range(dimension)
+)
+square_colours = tuple(colours[(row + column) % 2] for row in range(dimension) for column in range(dimension))
+board_bg = None  # Checkerboard drawn once by init_surfaces, then blitted every frame
+highlight_yellow = None  # Translucent square overlays, also built by init_surfaces
+highlight_green = None
+timer_font = None
+text_cache = {}  # Slot -> (text, rendered surface), see render_cached
+# Special action offered for the selected piece, by piece type
+extra_actions = {'P': 'Starve', 'N': 'Mimic', 'B': 'Detonate', 'R': 'Defect', 'K': 'Teleswap', 'Q': 'Teleswap'}
+button_labels = {}  # Button text -> rendered label, built by init_surfaces
+board_rect = p.Rect(0, 0, board_width, board_height)
+panel_rect = p.Rect(board_width, 0, move_log_panel_width, move_log_panel_height)
+timers_rect = p.Rect(board_width, 0, move_log_panel_width, 80)
+move_log_rect = p.Rect(board_width, 80, move_log_panel_width, move_log_panel_height - 80)
 
 # Globals for customization
 time_limit_minutes = None  # None == infinite
@@ -24,18 +49,60 @@ time_limit_minutes = None  # None == infinite
 
 
 def load_images():
-    """Load all piece PNGs from Chess/images."""
+    """Load all piece PNGs from Chess/images; call after the display mode is set."""
     script_dir = os.path.dirname(__file__)
     image_dir = os.path.join(script_dir, 'images')
-    pieces = [
-        'bR','bN','bB','bQ','bK','bB','bN','bR','bP',
-        'wR','wN','wB','wQ','wK','wB','wN','wR','wP'
-    ]
-    for piece in pieces:
+    for piece, code in ChessEngine.PIECE_CODES.items():
+        if code == ChessEngine.EMPTY:
+            continue
         path = os.path.join(image_dir, f'{piece}.png')
-        images[piece] = p.transform.smoothscale(
+        # convert_alpha matches the display's pixel format so blits need no per-pixel conversion
+        images[code] = p.transform.smoothscale(
             p.image.load(path), (sq_size, sq_size)
-        )
+        ).convert_alpha()
+
+
+def init_surfaces():
+    """Pre-render static surfaces; call after the display mode is set."""
+    global board_bg, highlight_yellow, highlight_green, timer_font
+    board_bg = p.Surface((board_width, board_height)).convert()
+    for rect, colour in zip(square_rects, square_colours):
+        p.draw.rect(board_bg, colour, rect)
+
+    highlight_yellow = p.Surface((sq_size, sq_size)).convert()
+    highlight_yellow.set_alpha(70)
+    highlight_yellow.fill(p.Color('yellow'))
+    highlight_green = p.Surface((sq_size, sq_size)).convert()
+    highlight_green.set_alpha(100)
+    highlight_green.fill(p.Color('green'))
+
+    timer_font = p.font.SysFont('Arial', 16, True)
+
+    btn_font = p.font.SysFont('Arial', 20, True)
+    for text in ('End Turn', *extra_actions.values()):
+        button_labels[text] = btn_font.render(text, True, p.Color('white'))
+
+
+def render_cached(slot, font, text, colour):
+    """Render text, reusing the surface last rendered for this slot if the text has not changed."""
+    cached = text_cache.get(slot)
+    if cached is None or cached[0] != text:
+        cached = (text, font.render(text, True, colour))
+        text_cache[slot] = cached
+    return cached[1]
+
+
+def index_moves(valid_moves):
+    """Map ((start_row, start_column), (end_row, end_column)) to the valid move between those squares."""
+    return {
+        ((move.start_row, move.start_column), (move.end_row, move.end_column)): move
+        for move in valid_moves
+    }
+
+
+def search_ai_move(game_state, valid_moves, tt, result):
+    """Thread target: find the AI's move on this copy of the game and put it on the result queue."""
+    result.put(ChessAI.find_best_move(game_state, valid_moves, tt=tt))
 
 
 def show_start_screen():
@@ -47,8 +114,8 @@ def show_start_screen():
     window_h = board_height
     screen = p.display.set_mode((window_w, window_h))
     raw_img = p.image.load(start_path)
-    bg = p.transform.smoothscale(raw_img, (window_w, window_h))
-    font = p.font.SysFont('Arial', 36, True)
+    bg = p.transform.smoothscale(raw_img, (window_w, window_h)).convert()
+    clock = p.time.Clock()
 
     while True:
         for event in p.event.get():
@@ -63,6 +130,7 @@ def show_start_screen():
                     return
         screen.blit(bg, (0, 0))
         p.display.flip()
+        clock.tick(30)
 
 
 def show_customize_screen():
@@ -139,15 +207,23 @@ def show_customize_screen():
 
 def main():
     """1) Start screen, 2) Customization, 3) Chess loop with timers, AI difficulty, and buttons."""
+    # Only these events are handled anywhere, so have SDL drop the rest (mouse motion etc.) at the source.
+    # The window events ask for a repaint after the window was uncovered or restored.
+    repaint_events = (p.VIDEOEXPOSE, p.WINDOWEXPOSED, p.WINDOWRESTORED)
+    p.event.set_blocked(None)
+    p.event.set_allowed([p.QUIT, p.KEYDOWN, p.MOUSEBUTTONDOWN, *repaint_events])
     show_start_screen()
     show_customize_screen()
 
     screen = p.display.set_mode((board_width + move_log_panel_width, board_height))
     clock = p.time.Clock()
     load_images()
+    init_surfaces()
     move_log_font = p.font.SysFont('Arial', 14, False, False)
     game_state = ChessEngine.GameState()
     valid_moves = game_state.get_valid_moves()
+    valid_moves_map = index_moves(valid_moves)
+    valid_moves_stale = False  # Set when the board changes; the moves are regenerated at the end of the frame
     move_made = False
     animate = False
     square_selected = ()
@@ -176,10 +252,28 @@ def main():
     btn_w = move_log_panel_width - 40
     btn_h = 40
     end_btn = p.Rect(btn_x, btn_y, btn_w, btn_h)
-    btn_font = p.font.SysFont('Arial', 20, True)
+
+    # Button for the selected piece's special action (see extra_actions), above End Turn
+    action_btn = p.Rect(btn_x, btn_y - 50, btn_w, btn_h)
+    extra_action = None
+    extra_btn = None
+    extra_key = None  # What extra_action was last worked out from
+
+    # The AI searches on a worker thread so the window keeps responding while it thinks
+    ai_thread = None
+    ai_result = None  # Queue the wanted search will put its move on; None when no result is awaited
+    tt = {}  # Transposition table kept across the AI's turns; its positions stay valid after an undo
+
+    # Frames are only redrawn when something on screen changed
+    dirty = True
+    drawn_times = None
+
+    # Called every frame, so looked up once
+    get_ticks = p.time.get_ticks
+    get_events = p.event.get
 
     while True:
-        now = p.time.get_ticks()
+        now = get_ticks()
         delta = (now - last_tick) / 1000.0  # seconds since last frame
         last_tick = now
 
@@ -194,33 +288,15 @@ def main():
             (not game_state.white_to_move and player_two)
         )
 
-        # Determine extra action based on selected piece
-        extra_action = None
-        extra_btn = None
-        if square_selected != () and human_turn:
-            r, c = square_selected
-            piece = game_state.board[r][c]
-            # Ensure it's the human's piece
-            if (piece.startswith('w') and game_state.white_to_move and player_one) or \
-               (piece.startswith('b') and not game_state.white_to_move and player_two):
-                p_type = piece[1]
-                if p_type == 'P':
-                    extra_action = 'Starve'
-                    extra_btn = p.Rect(btn_x, btn_y - 50, btn_w, btn_h)
-                elif p_type == 'N':
-                    extra_action = 'Mimic'
-                    extra_btn = p.Rect(btn_x, btn_y - 50, btn_w, btn_h)
-                elif p_type == 'B':
-                    extra_action = 'Detonate'
-                    extra_btn = p.Rect(btn_x, btn_y - 50, btn_w, btn_h)
-                elif p_type == 'R':
-                    extra_action = 'Defect'
-                    extra_btn = p.Rect(btn_x, btn_y - 50, btn_w, btn_h)
-                elif p_type in ('K', 'Q'):
-                    extra_action = 'Teleswap'
-                    extra_btn = p.Rect(btn_x, btn_y - 50, btn_w, btn_h)
-
-        for event in p.event.get():
+        # Coalesce the frame's events: only the latest click counts, and each key is handled once
+        events = get_events()
+        clicks = [event for event in events if event.type == p.MOUSEBUTTONDOWN]
+        key_presses = {event.key: event for event in events if event.type == p.KEYDOWN}
+        quits = [event for event in events if event.type == p.QUIT]
+        if any(event.type in repaint_events for event in events):
+            dirty = True
+        for event in quits[:1] + clicks[-1:] + list(key_presses.values()):
+            dirty = True
             if event.type == p.QUIT:
                 p.quit()
                 exit()
@@ -232,7 +308,7 @@ def main():
                 if end_btn.collidepoint(mx, my):
                     if pending_move and human_turn and not game_over:
                         # Before making move, record captured piece if any
-                        captured = pending_move.piece_captured
+                        captured = ChessEngine.PIECE_NAMES[pending_move.piece_captured]
                         if captured != '--' and captured[1] != 'K':
                             if captured[0] == 'w':
                                 fallen_white.append(captured)
@@ -249,26 +325,26 @@ def main():
                 elif extra_btn and extra_btn.collidepoint(mx, my) and extra_action == 'Starve':
                     if square_selected != ():
                         r, c = square_selected
-                        piece = game_state.board[r][c]
-                        if piece.endswith('P'):
+                        piece = ChessEngine.PIECE_NAMES[game_state.board[r * 8 + c]]
+                        if piece[1] == 'P':
                             # Record that pawn as fallen
-                            if piece.startswith('w'):
+                            if piece[0] == 'w':
                                 fallen_white.append(piece)
                             else:
                                 fallen_black.append(piece)
                             # Remove pawn
-                            game_state.board[r][c] = '--'
+                            game_state.set_piece(r, c, ChessEngine.EMPTY)
                             # Do NOT flip turn here
                             square_selected = ()
                             player_clicks = []
-                            valid_moves = game_state.get_valid_moves()
+                            valid_moves_stale = True
 
                 # 3) Did we click Mimic?
                 elif extra_btn and extra_btn.collidepoint(mx, my) and extra_action == 'Mimic':
                     if square_selected != ():
                         r, c = square_selected
-                        piece = game_state.board[r][c]
-                        color = 'w' if piece.startswith('w') else 'b'
+                        piece = ChessEngine.PIECE_NAMES[game_state.board[r * 8 + c]]
+                        color = 'w' if piece[0] == 'w' else 'b'
                         # Determine appropriate fallen stack
                         stack = fallen_white if color == 'w' else fallen_black
                         if len(stack) == 0:
@@ -285,134 +361,112 @@ def main():
                                 if color == 'w':
                                     fallen_white.append(fallen)
                                     # Replace knight with the popped piece
-                                    game_state.board[r][c] = new_piece
+                                    game_state.set_piece(r, c, ChessEngine.PIECE_CODES[new_piece])
                                 else:
                                     fallen_black.append(fallen)
-                                    game_state.board[r][c] = new_piece
+                                    game_state.set_piece(r, c, ChessEngine.PIECE_CODES[new_piece])
                                 # Do NOT flip turn here
                                 square_selected = ()
                                 player_clicks = []
-                                valid_moves = game_state.get_valid_moves()
+                                valid_moves_stale = True
 
                 # 4) Did we click Detonate?
                 elif extra_btn and extra_btn.collidepoint(mx, my) and extra_action == 'Detonate':
                     if square_selected != ():
                         r, c = square_selected
-                        # Loop over 3x3 centered on (r,c)
-                        for dr in (-1, 0, 1):
-                            for dc in (-1, 0, 1):
-                                rr = r + dr
-                                cc = c + dc
-                                if 0 <= rr < dimension and 0 <= cc < dimension:
-                                    target = game_state.board[rr][cc]
-                                    if target == '--':
-                                        continue
-                                    # If it's a king, mark in_check
-                                    if target[1] == 'K':
-                                        game_state.in_check = True
-                                    else:
-                                        # Record fallen piece
-                                        if target[0] == 'w':
-                                            fallen_white.append(target)
-                                        else:
-                                            fallen_black.append(target)
-                                    # Remove (unless it's a king)
-                                    if target[1] != 'K':
-                                        game_state.board[rr][cc] = '--'
+                        # Loop over the occupied squares of the 3x3 centered on (r,c), lowest square first
+                        occupancy = game_state.occupancy
+                        blast = blast_masks[r * 8 + c] & (occupancy[0] | occupancy[1])
+                        while blast:
+                            bit = blast & -blast
+                            blast ^= bit
+                            square = bit.bit_length() - 1
+                            target = ChessEngine.PIECE_NAMES[game_state.board[square]]
+                            # If it's a king, mark in_check
+                            if target[1] == 'K':
+                                game_state.in_check = True
+                            else:
+                                # Record fallen piece
+                                if target[0] == 'w':
+                                    fallen_white.append(target)
+                                else:
+                                    fallen_black.append(target)
+                            # Remove (unless it's a king)
+                            if target[1] != 'K':
+                                game_state.set_piece(*divmod(square, 8), ChessEngine.EMPTY)
                         # After detonation, update valid moves
                         square_selected = ()
                         player_clicks = []
-                        valid_moves = game_state.get_valid_moves()
+                        valid_moves_stale = True
 
                 # 5) Did we click Defect?
                 elif extra_btn and extra_btn.collidepoint(mx, my) and extra_action == 'Defect':
                     if square_selected != ():
                         r, c = square_selected
-                        piece = game_state.board[r][c]
-                        color = 'w' if piece.startswith('w') else 'b'
+                        piece = ChessEngine.PIECE_NAMES[game_state.board[r * 8 + c]]
+                        color = 'w' if piece[0] == 'w' else 'b'
                         # Determine appropriate fallen stack
                         stack = fallen_white if color == 'w' else fallen_black
                         # Check all 8 adjacent squares for enemy Pawn/ Knight/ Bishop
-                        for dr, dc in [(-1, -1), (-1, 0), (-1, 1),
-                                       (0, -1),           (0, 1),
-                                       (1, -1),  (1, 0),  (1, 1)]:
-                            rr = r + dr
-                            cc = c + dc
-                            if 0 <= rr < dimension and 0 <= cc < dimension:
-                                target = game_state.board[rr][cc]
-                                if target == '--':
-                                    continue
-                                # Must be enemy pawn ('P'), knight ('N') or bishop ('B')
-                                if target[0] != color and target[1] in ('P', 'N', 'B'):
-                                    needed = color + target[1]  # e.g., 'wN'
-                                    if needed in stack:
-                                        # Remove enemy piece
-                                        if target[0] == 'w':
-                                            fallen_white.append(target)
-                                        else:
-                                            fallen_black.append(target)
-                                        # Remove from our fallen stack
-                                        stack.remove(needed)
-                                        # Place our piece at rr,cc
-                                        game_state.board[rr][cc] = needed
+                        for square in neighbour_squares[r * 8 + c]:
+                            target = ChessEngine.PIECE_NAMES[game_state.board[square]]
+                            if target == '--':
+                                continue
+                            # Must be enemy pawn ('P'), knight ('N') or bishop ('B')
+                            if target[0] != color and target[1] in ('P', 'N', 'B'):
+                                needed = color + target[1]  # e.g., 'wN'
+                                if needed in stack:
+                                    # Remove enemy piece
+                                    if target[0] == 'w':
+                                        fallen_white.append(target)
+                                    else:
+                                        fallen_black.append(target)
+                                    # Remove from our fallen stack
+                                    stack.remove(needed)
+                                    # Place our piece on the square
+                                    game_state.set_piece(*divmod(square, 8), ChessEngine.PIECE_CODES[needed])
                         square_selected = ()
                         player_clicks = []
-                        valid_moves = game_state.get_valid_moves()
+                        valid_moves_stale = True
 
                 # 6) Did we click Teleswap?
                 elif extra_btn and extra_btn.collidepoint(mx, my) and extra_action == 'Teleswap':
                     if square_selected != ():
                         r, c = square_selected
-                        piece = game_state.board[r][c]
-                        color = 'w' if piece.startswith('w') else 'b'
+                        piece = ChessEngine.PIECE_NAMES[game_state.board[r * 8 + c]]
+                        color = 'w' if piece[0] == 'w' else 'b'
                         p_type = piece[1]  # 'K' or 'Q'
                         # Find the other (K or Q) of same color
                         other_type = 'Q' if p_type == 'K' else 'K'
-                        other_loc = None
-                        for rr in range(dimension):
-                            for cc in range(dimension):
-                                p2 = game_state.board[rr][cc]
-                                if p2 == f"{color}{other_type}":
-                                    other_loc = (rr, cc)
-                                    break
-                            if other_loc:
-                                break
+                        other_loc = game_state.find_piece(ChessEngine.PIECE_CODES[f"{color}{other_type}"])
                         if other_loc:
                             orow, ocol = other_loc
-                            # Swap positions
-                            game_state.board[orow][ocol], game_state.board[r][c] = (
-                                game_state.board[r][c],
-                                game_state.board[orow][ocol]
-                            )
+                            # Swap positions (set_piece also moves the king location)
+                            other_piece = game_state.board[orow * 8 + ocol]
+                            game_state.set_piece(orow, ocol, ChessEngine.PIECE_CODES[piece])
+                            game_state.set_piece(r, c, other_piece)
                             # Do NOT flip turn here
                         square_selected = ()
                         player_clicks = []
-                        valid_moves = game_state.get_valid_moves()
+                        valid_moves_stale = True
 
                 else:
-                    # 7) Board selection (only if human_turn and not game over)
-                    if human_turn and not game_over:
-                        column = mx // sq_size
-                        row = my // sq_size
-                        if column < dimension and row < dimension:
-                            if square_selected == (row, column):
-                                square_selected = ()
-                                player_clicks = []
-                            else:
-                                square_selected = (row, column)
-                                player_clicks.append(square_selected)
-                            if len(player_clicks) == 2:
-                                move = ChessEngine.Move(
-                                    player_clicks[0],
-                                    player_clicks[1],
-                                    game_state.board
-                                )
-                                for i in range(len(valid_moves)):
-                                    if move == valid_moves[i]:
-                                        pending_move = valid_moves[i]
-                                        break
-                                square_selected = ()
-                                player_clicks = []
+                    # 7) Board selection (only if human_turn and not game over).
+                    # The board spans the window's height, so only clicks right of it are on the panel.
+                    if human_turn and not game_over and mx < board_width:
+                        row, column = my // sq_size, mx // sq_size
+                        if square_selected == (row, column):
+                            square_selected = ()
+                            player_clicks = []
+                        else:
+                            square_selected = (row, column)
+                            player_clicks.append(square_selected)
+                        if len(player_clicks) == 2:
+                            move = valid_moves_map.get((player_clicks[0], player_clicks[1]))
+                            if move is not None:
+                                pending_move = move
+                            square_selected = ()
+                            player_clicks = []
 
             elif event.type == p.KEYDOWN:
                 if event.key == p.K_z:  # Undo (only if no pending_move)
@@ -421,9 +475,10 @@ def main():
                         move_made = True
                         animate = False
                         game_over = False
+                        ai_result = None  # A search for the undone position is no longer wanted
                 elif event.key == p.K_r:  # Reset entirely
                     game_state = ChessEngine.GameState()
-                    valid_moves = game_state.get_valid_moves()
+                    valid_moves_stale = True
                     square_selected = ()
                     player_clicks = []
                     pending_move = None
@@ -432,6 +487,8 @@ def main():
                     game_over = False
                     fallen_white.clear()
                     fallen_black.clear()
+                    ai_result = None
+                    tt.clear()
                     # Reset clocks
                     if time_limit_minutes is None:
                         white_time = None
@@ -441,13 +498,36 @@ def main():
                         black_time = total_secs
                     last_tick = p.time.get_ticks()
 
-        # AI move (when it’s AI’s turn and no pending player move)
-        if not game_over and not human_turn and not pending_move:
-            AI_move = ChessAI.find_best_move(game_state, valid_moves)
+        # AI move (when it’s AI’s turn and no pending player move).
+        # The turn is checked afresh since an undo or reset this frame may have changed it,
+        # and no search starts before valid_moves is refreshed for a move or action made this frame.
+        ai_turn = not (
+            (game_state.white_to_move and player_one) or
+            (not game_state.white_to_move and player_two)
+        )
+        if (not game_over and ai_turn and not pending_move and not move_made and not valid_moves_stale
+                and ai_result is None):
+            # ChessAI keeps its best move in a module global, so let an abandoned search finish first
+            if ai_thread is None or not ai_thread.is_alive():
+                ai_result = queue.Queue(maxsize=1)
+                ai_thread = threading.Thread(
+                    target=search_ai_move,
+                    args=(copy.deepcopy(game_state), list(valid_moves), tt, ai_result),
+                    daemon=True
+                )
+                ai_thread.start()
+        elif ai_result is not None and not ai_result.empty():
+            AI_move = ai_result.get()
+            ai_result = None
+            # The search ran on a copy, so use the matching move of this game state
+            if AI_move is not None:
+                AI_move = valid_moves_map.get(
+                    ((AI_move.start_row, AI_move.start_column), (AI_move.end_row, AI_move.end_column))
+                )
             if AI_move is None:
                 AI_move = ChessAI.find_random_move(valid_moves)
             # Record captured piece if any
-            captured = AI_move.piece_captured
+            captured = ChessEngine.PIECE_NAMES[AI_move.piece_captured]
             if captured != '--' and captured[1] != 'K':
                 if captured[0] == 'w':
                     fallen_white.append(captured)
@@ -462,29 +542,72 @@ def main():
                 animate_move(
                     game_state.move_log[-1], screen, game_state.board, clock
                 )
-            valid_moves = game_state.get_valid_moves()
+            valid_moves_stale = True
             move_made = False
             animate = False
+            dirty = True
 
-        # Draw everything
-        draw_game_state(
-            screen, game_state, square_selected, pending_move,
-            white_time, black_time, ChessAI.set_depth,
-            move_log_font, end_btn, btn_font, extra_btn, extra_action,
-            # No show_message parameter any more
+        # Regenerate the valid moves once per frame, however many changes to the board led here
+        if valid_moves_stale:
+            valid_moves = game_state.get_valid_moves()
+            valid_moves_map = index_moves(valid_moves)
+            valid_moves_stale = False
+
+        # Determine extra action based on selected piece, only when the selection, turn or piece changed.
+        # This comes after the frame's input and moves, so the button drawn is the one the next click sees.
+        human_turn = (
+            (game_state.white_to_move and player_one) or
+            (not game_state.white_to_move and player_two)
+        )
+        selected_piece = None
+        if square_selected != ():
+            selected_piece = game_state.board[square_selected[0] * 8 + square_selected[1]]
+        if (square_selected, human_turn, game_state.white_to_move, selected_piece) != extra_key:
+            extra_key = (square_selected, human_turn, game_state.white_to_move, selected_piece)
+            extra_action = None
+            extra_btn = None
+            dirty = True
+            if square_selected != () and human_turn:
+                piece = ChessEngine.PIECE_NAMES[selected_piece]
+                # Ensure it's the human's piece
+                if (piece[0] == 'w' and game_state.white_to_move and player_one) or \
+                   (piece[0] == 'b' and not game_state.white_to_move and player_two):
+                    extra_action = extra_actions.get(piece[1])
+                    if extra_action:
+                        extra_btn = action_btn
+
+        # The timers show whole seconds, so they only need redrawing when one of those changes
+        shown_times = (
+            None if white_time is None else int(white_time),
+            None if black_time is None else int(black_time)
         )
 
+        # Draw everything
+        if dirty:
+            draw_game_state(
+                screen, game_state, square_selected, pending_move,
+                white_time, black_time, ChessAI.set_depth,
+                move_log_font, end_btn, extra_btn, extra_action,
+                # No show_message parameter any more
+            )
+            p.display.flip()
+        elif shown_times != drawn_times:
+            # Only the timers changed, so only they are redrawn and sent to the display
+            draw_timers(screen, white_time, black_time, ChessAI.set_depth)
+            p.display.update(timers_rect)
+        dirty = False
+        drawn_times = shown_times
+
         if (game_state.checkmate or game_state.stalemate) and not game_over:
             game_over = True
 
         clock.tick(max_fps)
-        p.display.flip()
 
 
 def draw_game_state(
     screen, game_state, square_selected, pending_move,
     white_time, black_time, ai_diff, move_log_font,
-    end_btn, btn_font, extra_btn, extra_action
+    end_btn, extra_btn, extra_action
 ):
     """Draw board, highlights, timers, AI diff, move log, End Turn, and action buttons."""
     draw_board(screen)
@@ -494,76 +617,74 @@ def draw_game_state(
     draw_pieces(screen, game_state.board)
     draw_right_panel(
         screen, game_state, square_selected, white_time, black_time,
-        ai_diff, move_log_font, end_btn, btn_font, extra_btn, extra_action
+        ai_diff, move_log_font, end_btn, extra_btn, extra_action
     )
 
 
 def draw_board(screen):
     """Draw board squares."""
-    for row in range(dimension):
-        for column in range(dimension):
-            colour = colours[(row + column) % 2]
-            p.draw.rect(
-                screen, colour,
-                p.Rect(column * sq_size, row * sq_size, sq_size, sq_size)
-            )
+    screen.blit(board_bg, (0, 0))
 
 
 def highlight_squares(screen, game_state, square_selected):
     """Highlight selected square and last move."""
     if square_selected != ():
         row, column = square_selected
-        if game_state.board[row][column][0] == (
+        if ChessEngine.PIECE_NAMES[game_state.board[row * 8 + column]][0] == (
             'w' if game_state.white_to_move else 'b'
         ):
-            s = p.Surface((sq_size, sq_size))
-            s.set_alpha(70)
-            s.fill(p.Color('yellow'))
-            screen.blit(s, (column * sq_size, row * sq_size))
+            screen.blit(highlight_yellow, square_rects[row * 8 + column])
 
     if len(game_state.move_log) != 0:
         last_move = game_state.move_log[-1]
-        start_row, start_column = last_move.start_row, last_move.start_column
-        end_row, end_column = last_move.end_row, last_move.end_column
-        s = p.Surface((sq_size, sq_size))
-        s.set_alpha(70)
-        s.fill(p.Color('yellow'))
-        screen.blit(s, (start_column * sq_size, start_row * sq_size))
-        screen.blit(s, (end_column * sq_size, end_column * sq_size))
+        screen.blit(highlight_yellow, square_rects[last_move.start_row * 8 + last_move.start_column])
+        screen.blit(highlight_yellow, square_rects[last_move.end_row * 8 + last_move.end_column])
 
 
 def highlight_pending(screen, pending_move):
     """Highlight pending move in green until End Turn is pressed."""
-    s = p.Surface((sq_size, sq_size))
-    s.set_alpha(100)
-    s.fill(p.Color('green'))
-    screen.blit(s, (pending_move.start_column * sq_size, pending_move.start_row * sq_size))
-    screen.blit(s, (pending_move.end_column * sq_size, pending_move.end_row * sq_size))
+    screen.blit(highlight_green, square_rects[pending_move.start_row * 8 + pending_move.start_column])
+    screen.blit(highlight_green, square_rects[pending_move.end_row * 8 + pending_move.end_column])
 
 
 def draw_right_panel(
     screen, game_state, square_selected,
     white_time, black_time, ai_diff,
-    font, end_btn, btn_font, extra_btn, extra_action
+    font, end_btn, extra_btn, extra_action
 ):
     """Draw timers, AI difficulty, move log, End Turn button, and action button."""
-    panel_x = board_width
-    p.draw.rect(
-        screen, p.Color('#2d2d2e'),
-        p.Rect(panel_x, 0, move_log_panel_width, move_log_panel_height)
-    )
+    p.draw.rect(screen, p.Color('#2d2d2e'), panel_rect)
 
     # Timers & AI diff
-    timer_font = p.font.SysFont('Arial', 16, True)
+    draw_timers(screen, white_time, black_time, ai_diff)
+
+    # Draw move log below
+    draw_move_log(screen, game_state, font)
+
+    # Draw extra action button if applicable
+    if extra_btn and extra_action:
+        p.draw.rect(screen, p.Color('#444444'), extra_btn)
+        label = button_labels[extra_action]
+        screen.blit(label, label.get_rect(center=extra_btn.center))
+
+    # Draw “End Turn” button at bottom
+    p.draw.rect(screen, p.Color('#555555'), end_btn)
+    label = button_labels['End Turn']
+    screen.blit(label, label.get_rect(center=end_btn.center))
+
+
+def draw_timers(screen, white_time, black_time, ai_diff):
+    """Draw the timers and AI difficulty at the top of the right panel."""
+    p.draw.rect(screen, p.Color('#2d2d2e'), timers_rect)
     y_offset = 10
-    x_offset = panel_x + 10
+    x_offset = board_width + 10
 
     if white_time is None:
         wt_text = "White Time: ∞"
     else:
         m, s = divmod(int(white_time), 60)
         wt_text = f"White Time: {m:02d}:{s:02d}"
-    txt_w = timer_font.render(wt_text, True, p.Color('white'))
+    txt_w = render_cached('white_time', timer_font, wt_text, p.Color('white'))
     screen.blit(txt_w, (x_offset, y_offset))
 
     if black_time is None:
@@ -571,66 +692,17 @@ def draw_right_panel(
     else:
         m, s = divmod(int(black_time), 60)
         bt_text = f"Black Time: {m:02d}:{s:02d}"
-    txt_b = timer_font.render(bt_text, True, p.Color('white'))
+    txt_b = render_cached('black_time', timer_font, bt_text, p.Color('white'))
     screen.blit(txt_b, (x_offset, y_offset + 25))
 
     diff_text = f"AI Diff: {ai_diff}"
-    txt_d = timer_font.render(diff_text, True, p.Color('white'))
+    txt_d = render_cached('ai_diff', timer_font, diff_text, p.Color('white'))
     screen.blit(txt_d, (x_offset, y_offset + 50))
 
-    # Draw move log below
-    draw_move_log(screen, game_state, font)
-
-    # Draw extra action button if applicable
-    if extra_btn and extra_action == 'Starve':
-        p.draw.rect(screen, p.Color('#444444'), extra_btn)
-        label = btn_font.render("Starve", True, p.Color('white'))
-        lbl_rect = label.get_rect(
-            center=(extra_btn.x + extra_btn.w // 2, extra_btn.y + extra_btn.h // 2)
-        )
-        screen.blit(label, lbl_rect)
-    elif extra_btn and extra_action == 'Mimic':
-        p.draw.rect(screen, p.Color('#444444'), extra_btn)
-        label = btn_font.render("Mimic", True, p.Color('white'))
-        lbl_rect = label.get_rect(
-            center=(extra_btn.x + extra_btn.w // 2, extra_btn.y + extra_btn.h // 2)
-        )
-        screen.blit(label, lbl_rect)
-    elif extra_btn and extra_action == 'Detonate':
-        p.draw.rect(screen, p.Color('#444444'), extra_btn)
-        label = btn_font.render("Detonate", True, p.Color('white'))
-        lbl_rect = label.get_rect(
-            center=(extra_btn.x + extra_btn.w // 2, extra_btn.y + extra_btn.h // 2)
-        )
-        screen.blit(label, lbl_rect)
-    elif extra_btn and extra_action == 'Defect':
-        p.draw.rect(screen, p.Color('#444444'), extra_btn)
-        label = btn_font.render("Defect", True, p.Color('white'))
-        lbl_rect = label.get_rect(
-            center=(extra_btn.x + extra_btn.w // 2, extra_btn.y + extra_btn.h // 2)
-        )
-        screen.blit(label, lbl_rect)
-    elif extra_btn and extra_action == 'Teleswap':
-        p.draw.rect(screen, p.Color('#444444'), extra_btn)
-        label = btn_font.render("Teleswap", True, p.Color('white'))
-        lbl_rect = label.get_rect(
-            center=(extra_btn.x + extra_btn.w // 2, extra_btn.y + extra_btn.h // 2)
-        )
-        screen.blit(label, lbl_rect)
-
-    # Draw “End Turn” button at bottom
-    p.draw.rect(screen, p.Color('#555555'), end_btn)
-    label = btn_font.render("End Turn", True, p.Color('white'))
-    lbl_rect = label.get_rect(
-        center=(end_btn.x + end_btn.w // 2, end_btn.y + end_btn.h // 2)
-    )
-    screen.blit(label, lbl_rect)
-
 
 def draw_move_log(screen, game_state, font):
     """Draw the move log (below timers)."""
-    move_log_area = p.Rect(board_width, 80, move_log_panel_width, move_log_panel_height - 80)
-    p.draw.rect(screen, p.Color('#2d2d2e'), move_log_area)
+    p.draw.rect(screen, p.Color('#2d2d2e'), move_log_rect)
     move_log = game_state.move_log
     move_texts = []
     for i in range(0, len(move_log), 2):
@@ -648,64 +720,60 @@ def draw_move_log(screen, game_state, font):
         for j in range(move_per_row):
             if i + j < len(move_texts):
                 text += move_texts[i + j]
-        text_object = font.render(text, True, p.Color('whitesmoke'))
+        # Only the last line changes as moves are made, so the others come from the cache
+        text_object = render_cached(('move_log', i), font, text, p.Color('whitesmoke'))
         screen.blit(text_object, (board_width + padding, text_y))
         text_y += text_object.get_height() + line_spacing
 
 
 def animate_move(move, screen, board, clock):
-    """Animates a move smoothly."""
+    """Animates a move smoothly, only repainting the squares the moving piece passes over."""
     delta_row = move.end_row - move.start_row
     delta_column = move.end_column - move.start_column
     frames_per_square = 5
     frame_count = (abs(delta_row) + abs(delta_column)) * frames_per_square
 
+    # Everything but the moving piece stays put, so draw it once and keep a copy to erase with
+    draw_board(screen)
+    draw_pieces(screen, board)
+
+    # Erase destination square
+    end_sq = square_rects[move.end_row * 8 + move.end_column]
+    screen.blit(board_bg, end_sq, end_sq)
+
+    # Draw captured piece if any
+    if move.piece_captured != ChessEngine.EMPTY:
+        if move.is_en_passant_move:
+            en_passant_row = move.end_row + 1 if move.piece_captured & ChessEngine.BLACK else move.end_row - 1
+            end_sq = square_rects[en_passant_row * 8 + move.end_column]
+        screen.blit(images[move.piece_captured], end_sq)
+    background = screen.subsurface(board_rect).copy()
+
+    # The first frame shows the whole board, after that only where the piece was and now is
+    previous = board_rect
     for frame in range(frame_count + 1):
         row = move.start_row + delta_row * frame / frame_count
         column = move.start_column + delta_column * frame / frame_count
-        draw_board(screen)
-        draw_pieces(screen, board)
-
-        # Erase destination square
-        colour = colours[(move.end_row + move.end_column) % 2]
-        end_sq = p.Rect(
-            move.end_column * sq_size,
-            move.end_row * sq_size,
-            sq_size, sq_size
-        )
-        p.draw.rect(screen, colour, end_sq)
-
-        # Draw captured piece if any
-        if move.piece_captured != '--':
-            if move.is_en_passant_move:
-                en_passant_row = move.end_row + 1 if move.piece_captured[0] == 'b' else move.end_row - 1
-                end_sq = p.Rect(
-                    move.end_column * sq_size,
-                    en_passant_row * sq_size,
-                    sq_size, sq_size
-                )
-            screen.blit(images[move.piece_captured], end_sq)
+        piece_rect = p.Rect(column * sq_size, row * sq_size, sq_size, sq_size)
 
+        screen.blit(background, previous, previous)
         # Draw moving piece
-        screen.blit(
-            images[move.piece_moved],
-            p.Rect(column * sq_size, row * sq_size, sq_size, sq_size)
-        )
+        screen.blit(images[move.piece_moved], piece_rect)
 
-        p.display.flip()
+        p.display.update((previous, piece_rect))
+        previous = piece_rect
         clock.tick(60)
 
 
 def draw_pieces(screen, board):
     """Draw pieces onto board."""
-    for row in range(dimension):
-        for column in range(dimension):
-            piece = board[row][column]
-            if piece != '--':
-                screen.blit(
-                    images[piece],
-                    p.Rect(column * sq_size, row * sq_size, sq_size, sq_size)
-                )
+    # Bound to locals, as the loop runs over all 64 squares every frame
+    blit = screen.blit
+    piece_images = images
+    rects = square_rects
+    for square, piece in enumerate(board):
+        if piece:  # EMPTY is 0
+            blit(piece_images[piece], rects[square])
 
 
 def draw_endgame_text(screen, text):